@@ -8,6 +8,7 @@ import numpy as np
 from astropy import units as u
 from astropy.table import Table, vstack
 from gammapy.data import GTI
+from gammapy.modeling import Parameters
 from gammapy.modeling.models import DatasetModels, Models
 from gammapy.utils.scripts import make_name, make_path, read_yaml, to_yaml, write_yaml
 
@@ -243,6 +244,53 @@ class Datasets(collections.abc.MutableSequence):
             stat_sum += dataset.stat_sum()
         return stat_sum
 
+    def stat_sum_scan(self, parameters, values):
+        """Compute joint statistic function values for a scan of parameter values.
+
+        Datasets whose models do not depend on any of the scanned parameters
+        only add a constant to the joint statistic and are evaluated once.
+        The parameter values are restored afterwards.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to scan.
+        values : `~numpy.ndarray`
+            Parameter values, with shape ``(n_points, len(parameters))``.
+
+        Returns
+        -------
+        stats : `~numpy.ndarray`
+            Joint statistic function values, one per scan point.
+        """
+        values = np.asarray(values, dtype=float)
+
+        stat_constant = 0
+        datasets = []
+        for dataset in self:
+            if dataset.models is not None and any(
+                par in dataset.models.parameters for par in parameters
+            ):
+                datasets.append(dataset)
+            else:
+                stat_constant += dataset.stat_sum()
+
+        stats = np.full(len(values), stat_constant, dtype=np.float64)
+
+        # the scales do not change during the scan, so convert to factors at once
+        scales = np.array([par.scale for par in parameters])
+        factors = (values / scales).tolist()
+
+        with Parameters(parameters).restore_status():
+            for idx, point in enumerate(factors):
+                for par, factor in zip(parameters, point):
+                    par.factor = factor
+
+                for dataset in datasets:
+                    stats[idx] += dataset.stat_sum()
+
+        return stats
+
     def _stat_sum_likelihood(self):
         """Total statistic given the current model parameters without the priors."""
         stat_sum = 0
@@ -18,6 +18,7 @@ from gammapy.stats import (
     cash_sum_cython,
     get_wstat_mu_bkg,
     wstat,
+    wstat_sum_cython,
 )
 from gammapy.utils.fits import HDULocation, LazyFitsData
 from gammapy.utils.random import get_random_state
@@ -2551,6 +2552,23 @@ class MapDatasetOnOff(MapDataset):
         )
         return np.nan_to_num(on_stat_)
 
+    def _stat_sum_likelihood(self):
+        """Total statistic given the current model parameters without the priors."""
+        if self.counts_off is None:
+            return super()._stat_sum_likelihood()
+
+        data = [
+            self.counts.data,
+            self.counts_off.data,
+            self.alpha.data,
+            self.npred_signal().data,
+        ]
+
+        if self.mask is not None:
+            data = [_[self.mask.data] for _ in data]
+
+        return wstat_sum_cython(*[np.asarray(_, dtype=float).ravel() for _ in data])
+
     @property
     def _counts_statistic(self):
         """Counts statistics of the dataset."""
@@ -35,6 +35,23 @@ def test_datasets_likelihood(datasets):
     assert_allclose(likelihood, 14472200.0002)
 
 
+def test_datasets_stat_sum_scan(datasets):
+    x = datasets["test-1"].models.parameters["x"]
+    values = np.array([[1.0], [2.0], [3.0]])
+
+    stats = datasets.stat_sum_scan(parameters=[x], values=values)
+
+    expected = []
+    for value in values[:, 0]:
+        x.value = value
+        expected.append(datasets.stat_sum())
+    x.value = 1.99
+
+    assert_allclose(stats, expected)
+    assert_allclose(stats[0] - stats[1], 1)
+    assert_allclose(x.value, 1.99)
+
+
 def test_datasets_str(datasets):
     assert "Datasets" in str(datasets)
 
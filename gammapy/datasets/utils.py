@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
 from astropy.coordinates import SkyCoord
+import matplotlib.pyplot as plt
 from gammapy.maps import Map
 from gammapy.modeling.models.utils import cutout_template_models
 from . import Datasets
@@ -70,8 +71,6 @@ def apply_edisp(input_map, edisp):
 
 
 def get_figure(fig, width, height):
-    import matplotlib.pyplot as plt
-
     if plt.get_fignums():
         if not fig:
             fig = plt.gcf()
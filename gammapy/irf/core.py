@@ -191,17 +191,23 @@ class IRF(metaclass=abc.ABCMeta):
         """Map unit as a `~astropy.units.Unit` object."""
         return self._unit
 
+    @lazyproperty
+    def _axes_centers(self):
+        return [a.center for a in self.axes]
+
+    @lazyproperty
+    def _axes_interp(self):
+        return tuple([a.interp for a in self.axes])
+
     @lazyproperty
     def _interpolate(self):
         kwargs = self.interp_kwargs.copy()
         # Allow extrapolation with in bins
         kwargs["fill_value"] = None
-        points = [a.center for a in self.axes]
-        points_scale = tuple([a.interp for a in self.axes])
         return ScaledRegularGridInterpolator(
-            points,
+            self._axes_centers,
             self.quantity,
-            points_scale=points_scale,
+            points_scale=self._axes_interp,
             **kwargs,
         )
 
@@ -38,6 +38,10 @@ class PSF(IRF):
     def containment_radius(self, fraction, factor=20, **kwargs):
         """Containment radius at given axes coordinates.
 
+        The containment is evaluated once on the up-sampled rad axis and
+        shared by all fractions, so several fractions should be passed in
+        a single call rather than one call per fraction.
+
         Parameters
         ----------
         fraction : float or `~numpy.ndarray`
@@ -152,16 +156,26 @@ class PSF(IRF):
         ax = plt.gca() if ax is None else ax
 
         energy_true = self.axes["energy_true"]
+        offset = u.Quantity(offset)
 
-        for theta in offset:
-            for frac in fraction:
-                plot_kwargs = kwargs.copy()
-                radius = self.containment_radius(
-                    energy_true=energy_true.center, offset=theta, fraction=frac
-                )
-                plot_kwargs.setdefault("label", f"{theta}, {100 * frac:.1f}%")
-                with quantity_support():
-                    ax.plot(energy_true.center, radius, **plot_kwargs)
+        # compute all offsets and fractions at once, shape (offset, fraction, energy)
+        radius = self.containment_radius(
+            energy_true=energy_true.center,
+            offset=offset[:, np.newaxis, np.newaxis],
+            fraction=np.reshape(fraction, (-1, 1)),
+        )
+
+        label = kwargs.pop("label", None)
+
+        with quantity_support():
+            for idx, theta in enumerate(offset):
+                for jdx, frac in enumerate(fraction):
+                    ax.plot(
+                        energy_true.center,
+                        radius[idx, jdx],
+                        label=label or f"{theta}, {100 * frac:.1f}%",
+                        **kwargs,
+                    )
 
         energy_true.format_plot_xaxis(ax=ax)
         ax.legend(loc="best")
@@ -203,8 +217,6 @@ class PSF(IRF):
         ax : `~matplotlib.pyplot.Axes`
              Matplotlib axes.
         """
-        ax = plt.gca() if ax is None else ax
-
         energy = self.axes["energy_true"]
         offset = self.axes["offset"]
 
@@ -215,10 +227,37 @@ class PSF(IRF):
             fraction=fraction,
         )
 
+        return self._plot_containment_radius_image(
+            containment,
+            fraction=fraction,
+            ax=ax,
+            add_cbar=add_cbar,
+            axes_loc=axes_loc,
+            kwargs_colorbar=kwargs_colorbar,
+            **kwargs,
+        )
+
+    def _plot_containment_radius_image(
+        self,
+        containment,
+        fraction,
+        ax=None,
+        add_cbar=True,
+        axes_loc=None,
+        kwargs_colorbar=None,
+        **kwargs,
+    ):
+        """Plot a containment radius image computed on the energy and offset axes."""
+        ax = plt.gca() if ax is None else ax
+
+        energy = self.axes["energy_true"]
+        offset = self.axes["offset"]
+
         # plotting defaults
         kwargs.setdefault("cmap", "GnBu")
         kwargs.setdefault("vmin", np.nanmin(containment.value))
         kwargs.setdefault("vmax", np.nanmax(containment.value))
+        kwargs.setdefault("rasterized", True)
 
         kwargs_colorbar = kwargs_colorbar or {}
 
@@ -293,7 +332,17 @@ class PSF(IRF):
         """
         fig, axes = plt.subplots(nrows=1, ncols=3, figsize=figsize)
 
-        self.plot_containment_radius(fraction=0.68, ax=axes[0])
-        self.plot_containment_radius(fraction=0.95, ax=axes[1])
+        fraction = [0.68, 0.95]
+
+        # compute both containment images in a single call
+        containment = self.containment_radius(
+            energy_true=self.axes["energy_true"].center[:, np.newaxis],
+            offset=self.axes["offset"].center,
+            fraction=np.reshape(fraction, (-1, 1, 1)),
+        )
+
+        for ax, value, radius in zip(axes[:2], fraction, containment):
+            self._plot_containment_radius_image(radius, fraction=value, ax=ax)
+
         self.plot_containment_radius_vs_energy(ax=axes[2])
         plt.tight_layout()
@@ -3,7 +3,9 @@ import abc
 import logging
 import numpy as np
 from astropy import units as u
+from astropy.utils import lazyproperty
 from gammapy.maps import MapAxes, MapAxis
+from gammapy.utils.compat import COPY_IF_NEEDED
 from gammapy.utils.gauss import MultiGauss2D
 from gammapy.utils.interpolation import ScaledRegularGridInterpolator
 from .core import PSF
@@ -28,6 +30,11 @@ class ParametricPSF(PSF):
         Metadata dictionary.
     """
 
+    def __init__(self, *args, _allow_missing_parameters=False, **kwargs):
+        # only `from_table` with ``columns`` creates PSFs with a subset of parameters
+        self._allow_missing_parameters = _allow_missing_parameters
+        super().__init__(*args, **kwargs)
+
     @property
     @abc.abstractmethod
     def required_parameters(self):
@@ -45,12 +52,60 @@ class ParametricPSF(PSF):
         """Normalize parametric PSF."""
         raise NotImplementedError
 
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        """Set data.
+
+        Parameters
+        ----------
+        value : dict of `~numpy.ndarray` or `~numpy.recarray`
+            Parameter arrays, one per required parameter.
+        """
+        required_shape = self.axes.shape
+        names = value.keys() if isinstance(value, dict) else value.dtype.names
+
+        invalid = set(names).difference(self.required_parameters)
+
+        if invalid:
+            raise ValueError(
+                f"Invalid parameters {sorted(invalid)}, "
+                f"choose from {self.required_parameters}"
+            )
+
+        missing = [name for name in self.required_parameters if name not in names]
+
+        if missing and not self._allow_missing_parameters:
+            raise ValueError(f"Missing parameters {missing} for {self.tag}")
+
+        data = {}
+        for name in self.required_parameters:
+            if name not in names:
+                continue
+
+            # fields of structured arrays are strided views, store them contiguous
+            data[name] = np.ascontiguousarray(value[name])
+
+            if data[name].shape != required_shape:
+                raise ValueError(
+                    f"data shape {data[name].shape} for parameter {name} does "
+                    f"not match axes shape {required_shape}"
+                )
+
+        self._data = data
+
+        # reset cached interpolator
+        self.__dict__.pop("_interpolator", None)
+
     @property
     def quantity(self):
         """Quantity."""
         quantity = {}
 
-        for name in self.required_parameters:
+        for name in self.data:
             quantity[name] = self.data[name] * self.unit[name]
 
         return quantity
@@ -64,23 +119,33 @@ class ParametricPSF(PSF):
         """Convert IRF to unit."""
         raise NotImplementedError
 
-    @property
-    def _interpolators(self):
-        interps = {}
+    @lazyproperty
+    def _interpolator(self):
+        missing = [name for name in self.required_parameters if name not in self.data]
 
-        for name in self.required_parameters:
-            points = [a.center for a in self.axes]
-            points_scale = tuple([a.interp for a in self.axes])
-            interps[name] = ScaledRegularGridInterpolator(
-                points, values=self.quantity[name], points_scale=points_scale
+        if missing:
+            raise ValueError(
+                f"Cannot evaluate {self.tag}, missing parameters {missing}. "
+                "Read all parameters with `from_table` to evaluate the PSF."
             )
 
-        return interps
+        # interpolate all parameters at once, stacked along a trailing axis
+        values = np.stack(
+            [self.data[name] for name in self.required_parameters], axis=-1
+        )
+        # a PSF defined on a single point is constant
+        method = "nearest" if all(a.nbin == 1 for a in self.axes) else None
+        return ScaledRegularGridInterpolator(
+            self._axes_centers,
+            values=values,
+            points_scale=self._axes_interp,
+            method=method,
+        )
 
     def evaluate_parameters(self, energy_true, offset):
         """Evaluate analytic PSF parameters at a given energy and offset.
 
-        Uses nearest-neighbor interpolation.
+        Uses linear interpolation.
 
         Parameters
         ----------
@@ -91,13 +156,16 @@ class ParametricPSF(PSF):
 
         Returns
         -------
-        values : `~astropy.units.Quantity`
-            Interpolated value.
+        values : dict of `~astropy.units.Quantity`
+            Interpolated values, one per parameter.
         """
+        values = self._interpolator((energy_true, offset))
+
         pars = {}
-        for name in self.required_parameters:
-            value = self._interpolators[name]((energy_true, offset))
-            pars[name] = value
+        for idx, name in enumerate(self.required_parameters):
+            pars[name] = u.Quantity(
+                values[..., idx], self.unit[name], copy=COPY_IF_NEEDED
+            )
 
         return pars
 
@@ -109,27 +177,27 @@ class ParametricPSF(PSF):
         format : {"gadf-dl3"}
             Format specification. Default is "gadf-dl3".
 
-
         Returns
         -------
-        hdu_list : `~astropy.io.fits.HDUList`
-            PSF in HDU list format.
+        table : `~astropy.table.Table`
+            PSF table.
         """
         from gammapy.irf.io import IRF_DL3_HDU_SPECIFICATION
 
         table = self.axes.to_table(format="gadf-dl3")
         spec = IRF_DL3_HDU_SPECIFICATION[self.tag]["column_name"]
 
-        for name in self.required_parameters:
+        for name in self.data:
             column_name = spec[name]
-            table[column_name] = self.data[name].T[np.newaxis]
+            # single explicit copy to C order, shared by the table column
+            values = np.ascontiguousarray(self.data[name].T)[np.newaxis]
+            table.add_column(values, name=column_name, copy=False)
             table[column_name].unit = self.unit[name]
 
-        # Create hdu and hdu list
         return table
 
     @classmethod
-    def from_table(cls, table, format="gadf-dl3"):
+    def from_table(cls, table, format="gadf-dl3", columns=None):
         """Create parametric PSF from `~astropy.table.Table`.
 
         Parameters
@@ -138,6 +206,11 @@ class ParametricPSF(PSF):
             Table information.
         format : {"gadf-dl3"}, optional
             Format specification. Default is "gadf-dl3".
+        columns : list of str, optional
+            Parameters to read, a subset of `required_parameters`. A PSF read
+            with only some of the parameters can be used to inspect their data,
+            but not to evaluate the PSF.
+            Default is None, which reads all parameters.
 
         Returns
         -------
@@ -146,31 +219,43 @@ class ParametricPSF(PSF):
         """
         from gammapy.irf.io import IRF_DL3_HDU_SPECIFICATION
 
-        axes = MapAxes.from_table(table, format=format)[cls.required_axes]
+        if columns is None:
+            columns = cls.required_parameters
 
-        dtype = {
-            "names": cls.required_parameters,
-            "formats": len(cls.required_parameters) * (np.float32,),
-        }
+        invalid = set(columns).difference(cls.required_parameters)
 
-        data = np.empty(axes.shape, dtype=dtype)
-        unit = {}
+        if invalid:
+            raise ValueError(
+                f"Invalid parameters {sorted(invalid)}, "
+                f"choose from {cls.required_parameters}"
+            )
+
+        axes = MapAxes.from_table(table, format=format)[cls.required_axes]
+
+        data, unit = {}, {}
 
         spec = IRF_DL3_HDU_SPECIFICATION[cls.tag]["column_name"]
 
-        for name in cls.required_parameters:
+        for name in columns:
             column = table[spec[name]]
-            values = column.data[0].transpose()
+            # single copy to float32 and C order, parameters are stored as float32
+            values = column.data[0].transpose().astype(np.float32, order="C")
 
             # This fixes some files where sigma is written as zero
             if "sigma" in name:
-                values[values == 0] = 1.0
+                values = np.where(values == 0, np.float32(1.0), values)
 
             data[name] = values.reshape(axes.shape)
             unit[name] = column.unit or ""
 
         unit = {key: u.Unit(val) for key, val in unit.items()}
-        return cls(axes=axes, data=data, meta=table.meta.copy(), unit=unit)
+        return cls(
+            axes=axes,
+            data=data,
+            meta=table.meta.copy(),
+            unit=unit,
+            _allow_missing_parameters=set(columns) != set(cls.required_parameters),
+        )
 
     def to_psf3d(self, rad=None):
         """Create a PSF3D from a parametric PSF.
@@ -203,11 +288,82 @@ class ParametricPSF(PSF):
 
         return PSF3D(axes=axes, data=data.value, unit=data.unit, meta=self.meta.copy())
 
+    def pad(self, pad_width, axis_name, **kwargs):
+        """Pad PSF along a given axis.
+
+        Parameters
+        ----------
+        pad_width : {sequence, array_like, int}
+            Number of pixels padded to the edges of each axis.
+        axis_name : str
+            Axis to pad.
+        **kwargs : dict
+            Keyword argument forwarded to `~numpy.pad`.
+
+        Returns
+        -------
+        psf : `ParametricPSF`
+            Padded PSF.
+        """
+        if np.isscalar(pad_width):
+            pad_width = (pad_width, pad_width)
+
+        idx = self.axes.index(axis_name)
+        pad_width_np = [(0, 0)] * len(self.axes)
+        pad_width_np[idx] = pad_width
+
+        kwargs.setdefault("mode", "constant")
+
+        axes = self.axes.pad(axis_name=axis_name, pad_width=pad_width)
+        data = {
+            name: np.pad(value, pad_width=pad_width_np, **kwargs)
+            for name, value in self.data.items()
+        }
+        return self.__class__(
+            axes=axes,
+            data=data,
+            unit=self.unit,
+            meta=self.meta.copy(),
+            _allow_missing_parameters=self._allow_missing_parameters,
+        )
+
+    def slice_by_idx(self, slices):
+        """Slice sub PSF from PSF object.
+
+        Parameters
+        ----------
+        slices : dict
+            Dictionary of axes names and `slice` object pairs. Axes not
+            specified in the dictionary are kept unchanged.
+
+        Returns
+        -------
+        sliced : `ParametricPSF`
+            Sliced PSF object.
+        """
+        axes = self.axes.slice_by_idx(slices)
+
+        diff = set(self.axes.names).difference(axes.names)
+
+        if diff:
+            diff_slice = {key: value for key, value in slices.items() if key in diff}
+            raise ValueError(f"Integer indexing not supported, got {diff_slice}")
+
+        slices = tuple([slices.get(ax.name, slice(None)) for ax in self.axes])
+        data = {name: value[slices] for name, value in self.data.items()}
+        return self.__class__(
+            axes=axes,
+            data=data,
+            unit=self.unit,
+            meta=self.meta,
+            _allow_missing_parameters=self._allow_missing_parameters,
+        )
+
     def __str__(self):
         str_ = f"{self.__class__.__name__}\n"
         str_ += "-" * len(self.__class__.__name__) + "\n\n"
         str_ += f"\taxes      : {self.axes.names}\n"
-        str_ += f"\tshape     : {self.data.shape}\n"
+        str_ += f"\tshape     : {self.axes.shape}\n"
         str_ += f"\tndim      : {len(self.axes)}\n"
         str_ += f"\tparameters: {self.required_parameters}\n"
         return str_.expandtabs(tabsize=2)
@@ -270,7 +426,11 @@ class ParametricPSF(PSF):
             Whether the IRF is all close.
         """
         if not isinstance(other, self.__class__):
-            return TypeError(f"Cannot compare {type(self)} and {type(other)}")
+            raise TypeError(f"Cannot compare {type(self)} and {type(other)}")
+
+        # PSFs read with a subset of parameters can hold different parameters
+        if self.data.keys() != other.data.keys():
+            return False
 
         data_eq = True
 
@@ -305,8 +465,8 @@ class EnergyDependentMultiGaussPSF(ParametricPSF):
             * energy_true (true energy axis)
             * migra_axis (energy migration axis)
             * offset_axis (field of view offset axis)
-    data : `~numpy.recarray`
-        Data array.
+    data : dict of `~numpy.ndarray` or `~numpy.recarray`
+        Parameter arrays.
     meta : dict
         Metadata dictionary.
 
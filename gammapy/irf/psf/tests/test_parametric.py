@@ -8,6 +8,7 @@ from astropy.coordinates import Angle
 from astropy.io import fits
 from astropy.utils.data import get_pkg_data_filename
 from gammapy.irf import EnergyDependentMultiGaussPSF, PSFKing
+from gammapy.maps import MapAxis
 from gammapy.utils.testing import mpl_plot_check, requires_data
 
 
@@ -73,7 +74,7 @@ class TestEnergyDependentMultiGaussPSF:
         psf1 = deepcopy(psf)
         assert psf1 == psf
 
-        psf1.data[0][0] = 10
+        psf1.data["sigma_1"][0][0] = 10
         assert not psf1 == psf
 
     def test_peek(self, psf):
@@ -167,3 +168,115 @@ def test_psf_king_write(psf_king, tmp_path):
     assert_allclose(psf_king2.axes["offset"].center, psf_king.axes["offset"].center)
     assert_allclose(psf_king2.data["gamma"], psf_king.data["gamma"])
     assert_allclose(psf_king2.data["sigma"], psf_king.data["sigma"])
+
+
+@pytest.fixture()
+def psf_king_simple():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "100 TeV", nbin=3, name="energy_true"
+    )
+    offset_axis = MapAxis.from_edges([0, 1, 2] * u.deg, name="offset")
+
+    data = {
+        "gamma": np.full((3, 2), 2.0, dtype=np.float32),
+        "sigma": np.array([[0.2, 0.25], [0.1, 0.12], [0.05, 0.06]], dtype=np.float32),
+    }
+    unit = {"gamma": u.Unit(""), "sigma": u.deg}
+    return PSFKing(axes=[energy_axis_true, offset_axis], data=data, unit=unit)
+
+
+def test_psf_king_containment_radius_fractions(psf_king_simple):
+    energy_true = [1, 10] * u.TeV
+    fraction = [0.68, 0.95]
+
+    radius = psf_king_simple.containment_radius(
+        energy_true=energy_true[:, np.newaxis], offset=0.5 * u.deg, fraction=fraction
+    )
+    assert radius.shape == (2, 2)
+
+    for idx, value in enumerate(fraction):
+        desired = psf_king_simple.containment_radius(
+            energy_true=energy_true, offset=0.5 * u.deg, fraction=value
+        )
+        assert_allclose(radius[:, idx], desired)
+
+
+def test_psf_king_containment_radius_data_change(psf_king_simple):
+    kwargs = dict(energy_true=1 * u.TeV, offset=0.5 * u.deg)
+
+    radius = psf_king_simple.containment_radius(fraction=0.68, **kwargs)
+
+    data = psf_king_simple.data.copy()
+    data["sigma"] = 2 * data["sigma"]
+    psf_king_simple.data = data
+
+    radius_wide = psf_king_simple.containment_radius(fraction=0.68, **kwargs)
+    assert radius_wide > radius
+
+
+def test_psf_king_from_table_columns(psf_king_simple):
+    table = psf_king_simple.to_table()
+
+    psf = PSFKing.from_table(table, columns=["sigma"])
+    assert list(psf.data) == ["sigma"]
+    assert_allclose(psf.data["sigma"], psf_king_simple.data["sigma"])
+
+    with pytest.raises(ValueError):
+        PSFKing.from_table(table, columns=["sigma", "norm"])
+
+    with pytest.raises(ValueError, match="missing parameters"):
+        psf.containment_radius(energy_true=1 * u.TeV, offset=0.5 * u.deg, fraction=0.68)
+
+
+def test_psf_king_data_invalid(psf_king_simple):
+    axes = psf_king_simple.axes
+    data = psf_king_simple.data
+
+    with pytest.raises(ValueError, match="Missing parameters"):
+        PSFKing(axes=axes, data={"sigma": data["sigma"]})
+
+    with pytest.raises(ValueError, match="Invalid parameters"):
+        PSFKing(axes=axes, data={"gama": data["gamma"], "sigma": data["sigma"]})
+
+
+def test_psf_king_pad(psf_king_simple):
+    psf = psf_king_simple.pad(1, axis_name="offset")
+
+    assert psf.data["sigma"].shape == (3, 4)
+    assert psf.axes["offset"].nbin == 4
+    assert_allclose(psf.data["sigma"][:, 1:-1], psf_king_simple.data["sigma"])
+    assert_allclose(psf.data["gamma"][:, 0], 0)
+
+
+def test_psf_multi_gauss_pad():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "100 TeV", nbin=3, name="energy_true"
+    )
+    offset_axis = MapAxis.from_edges([0, 1, 2] * u.deg, name="offset")
+
+    names = EnergyDependentMultiGaussPSF.required_parameters
+    data = {name: np.ones((3, 2), dtype=np.float32) for name in names}
+    unit = {name: u.deg if "sigma" in name else u.Unit("") for name in names}
+    psf = EnergyDependentMultiGaussPSF(
+        axes=[energy_axis_true, offset_axis], data=data, unit=unit
+    )
+
+    padded = psf.pad(1, axis_name="offset")
+
+    assert padded.data["sigma_1"].shape == (3, 4)
+    assert list(padded.data) == names
+    assert_allclose(padded.data["scale"][:, 1:-1], 1)
+    assert_allclose(padded.data["scale"][:, [0, -1]], 0)
+
+
+def test_psf_king_is_allclose(psf_king_simple):
+    table = psf_king_simple.to_table()
+    psf = PSFKing.from_table(table)
+    psf_sigma = PSFKing.from_table(table, columns=["sigma"])
+
+    assert psf.is_allclose(psf_king_simple)
+    assert not psf_sigma.is_allclose(psf_king_simple)
+    assert not psf_king_simple.is_allclose(psf_sigma)
+
+    with pytest.raises(TypeError):
+        psf_king_simple.is_allclose(psf_king_simple.to_psf3d())
@@ -4,6 +4,8 @@ import itertools
 import logging
 import numpy as np
 from astropy.table import Table
+from astropy.utils import lazyproperty
+import gammapy.utils.parallel as parallel
 from gammapy.utils.pbar import progress_bar
 from gammapy.modeling.utils import _parse_datasets
 from .covariance import Covariance
@@ -21,6 +23,74 @@ __all__ = ["Fit", "FitResult", "OptimizeResult", "CovarianceResult"]
 log = logging.getLogger(__name__)
 
 
+def _unique_names(datasets, parameters):
+    """Get the unique names of parameters of the datasets models.
+
+    Parameters
+    ----------
+    datasets : `~gammapy.datasets.Datasets`
+        Datasets.
+    parameters : list of `~gammapy.modeling.Parameter`
+        Parameters of the datasets models.
+
+    Returns
+    -------
+    names : list of str
+        Unique parameter names.
+    """
+    models = datasets.models
+    unique_parameters = models.parameters.unique_parameters
+    index = {id(par): idx for idx, par in enumerate(unique_parameters)}
+    unique_names = models.parameters_unique_names
+    return [unique_names[index[id(par)]] for par in parameters]
+
+
+def _stat_scan_points(fit, datasets, indices, points, reoptimize):
+    """Evaluate the total fit statistic at a list of parameter values.
+
+    Used to run parts of a scan in a separate process.
+
+    Parameters
+    ----------
+    fit : `Fit`
+        Fit instance used to re-optimize the other parameters.
+    datasets : `~gammapy.datasets.Datasets`
+        Datasets.
+    indices : list of int
+        Indices of the scanned parameters in ``datasets.parameters``.
+    points : `~numpy.ndarray`
+        Parameter values, with shape ``(n_points, len(indices))``.
+    reoptimize : bool
+        Re-optimize other parameters at each point.
+
+    Returns
+    -------
+    stats, fit_results : `~numpy.ndarray`, list of `OptimizeResult`
+        Fit statistic values and optimization results. The latter are
+        empty if ``reoptimize`` is False.
+    """
+    parameters = datasets.parameters
+    scan_parameters = [parameters[idx] for idx in indices]
+
+    if not reoptimize:
+        stats = datasets.stat_sum_scan(parameters=scan_parameters, values=points)
+        return stats, []
+
+    stats, fit_results = fit._stat_scan_reoptimize(
+        datasets=datasets,
+        parameters=parameters,
+        scan_parameters=scan_parameters,
+        points=points,
+        desc="Scan values",
+    )
+
+    # the minuit object holds a reference to the datasets of this process
+    for result in fit_results:
+        result._minuit = None
+
+    return stats, fit_results
+
+
 class Registry:
     """Registry of available backends for given tasks.
 
@@ -111,6 +181,12 @@ class Fit:
         interval can be adapted by modifying the upper bound of the interval (``b``) value.
     store_trace : bool
         Whether to store the trace of the fit.
+
+    Notes
+    -----
+    The backend functions and options are resolved once and reused for all
+    subsequent calls. To change the options, assign a new dictionary, e.g.
+    ``fit.optimize_opts = {"tol": 0.1}``, instead of modifying it in place.
     """
 
     def __init__(
@@ -137,6 +213,71 @@ class Fit:
         self.covariance_opts = covariance_opts
         self.confidence_opts = confidence_opts
         self._minuit = None
+        self._minuit_datasets = None
+
+    def _reset_backend_cache(self):
+        for name in ["_optimize_backend", "_covariance_backend", "_confidence_backend"]:
+            self.__dict__.pop(name, None)
+
+    def _resolve_backend(self, task, opts):
+        kwargs = opts.copy()
+        backend = kwargs.pop("backend", self.backend)
+        return backend, registry.get(task, backend), kwargs
+
+    @property
+    def backend(self):
+        """Global backend used for fitting."""
+        return self._backend
+
+    @backend.setter
+    def backend(self, value):
+        self._backend = value
+        self._reset_backend_cache()
+
+    @property
+    def optimize_opts(self):
+        """Keyword arguments passed to the optimizer."""
+        return self._optimize_opts
+
+    @optimize_opts.setter
+    def optimize_opts(self, value):
+        self._optimize_opts = value
+        self.__dict__.pop("_optimize_backend", None)
+
+    @property
+    def covariance_opts(self):
+        """Covariance options passed to the given backend."""
+        return self._covariance_opts
+
+    @covariance_opts.setter
+    def covariance_opts(self, value):
+        self._covariance_opts = value
+        self.__dict__.pop("_covariance_backend", None)
+
+    @property
+    def confidence_opts(self):
+        """Extra arguments passed to the confidence backend."""
+        return self._confidence_opts
+
+    @confidence_opts.setter
+    def confidence_opts(self, value):
+        self._confidence_opts = value
+        self.__dict__.pop("_confidence_backend", None)
+
+    @lazyproperty
+    def _optimize_backend(self):
+        """Optimize backend name, function and options."""
+        return self._resolve_backend("optimize", self.optimize_opts)
+
+    @lazyproperty
+    def _covariance_backend(self):
+        """Covariance backend name, function and options."""
+        return self._resolve_backend("covariance", self.covariance_opts)
+
+    @lazyproperty
+    def _confidence_backend(self):
+        """Confidence backend name, function and options."""
+        return self._resolve_backend("confidence", self.confidence_opts)
 
     def _repr_html_(self):
         try:
@@ -160,14 +301,14 @@ class Fit:
 
         datasets, parameters = _parse_datasets(datasets=datasets)
 
-        optimize_result = self.optimize(datasets=datasets)
+        optimize_result = self._optimize(datasets=datasets, parameters=parameters)
 
         if self.backend not in registry.register["covariance"]:
             log.warning("No covariance estimate - not supported by this backend.")
             return FitResult(optimize_result=optimize_result)
 
-        covariance_result = self.covariance(
-            datasets=datasets, optimize_result=optimize_result
+        covariance_result = self._covariance(
+            datasets=datasets, unique_pars=parameters, optimize_result=optimize_result
         )
 
         optimize_result.models.covariance = Covariance(
@@ -195,17 +336,34 @@ class Fit:
             Optimization result.
         """
         datasets, parameters = _parse_datasets(datasets=datasets)
-        datasets.parameters.check_limits()
+        return self._optimize(datasets=datasets, parameters=parameters)
+
+    def _optimize(
+        self, datasets, parameters, copy_models=True, trace_names=None, **extra_kwargs
+    ):
+        """Run the optimization on already parsed datasets.
+
+        If ``copy_models`` is False, the best fit models are only copied when
+        `OptimizeResult.models` is accessed. The ``trace_names`` of the free
+        parameters can be given to avoid looking them up on every call, e.g.
+        during a parameter scan.
+
+        Extra keyword arguments are passed to the backend in addition to the
+        ``optimize_opts``, e.g. the ``minuit`` object to re-use with the
+        `"minuit"` backend.
+        """
+        parameters.check_limits()
 
         if len(parameters.free_parameters.names) == 0:
             raise ValueError("No free parameters for fitting")
 
         parameters.autoscale()
 
-        kwargs = self.optimize_opts.copy()
-        backend = kwargs.pop("backend", self.backend)
+        backend, compute, kwargs = self._optimize_backend
+
+        if extra_kwargs:
+            kwargs = {**kwargs, **extra_kwargs}
 
-        compute = registry.get("optimize", backend)
         # TODO: change this calling interface!
         # probably should pass a fit statistic, which has a model, which has parameters
         # and return something simpler, not a tuple of three things
@@ -216,34 +374,48 @@ class Fit:
             **kwargs,
         )
 
+        method = kwargs.get("method", backend)
+
         if backend == "minuit":
             self._minuit = optimizer
-            kwargs["method"] = "migrad"
+            self._minuit_datasets = list(datasets), list(parameters)
+            method = "migrad"
 
-        trace = Table(info.pop("trace"))
+        trace = info.pop("trace")
+        # backends return the statistic at the best fit, so it is not recomputed
+        total_stat = info.pop("fval", None)
 
         if self.store_trace:
-            idx = [
-                parameters.index(par)
-                for par in parameters.unique_parameters.free_parameters
-            ]
-            unique_names = np.array(datasets.models.parameters_unique_names)[idx]
-            trace.rename_columns(trace.colnames[1:], list(unique_names))
+            if trace_names is None:
+                trace_names = _unique_names(
+                    datasets, parameters.unique_parameters.free_parameters
+                )
+
+            trace = Table(trace, names=["total_stat", *trace_names])
+        else:
+            trace = Table()
 
         # Copy final results into the parameters object
         parameters.set_parameter_factors(factors)
         parameters.check_limits()
 
-        return OptimizeResult(
-            models=datasets.models.copy(),
-            total_stat=datasets.stat_sum(),
+        if total_stat is None:
+            total_stat = datasets.stat_sum()
+
+        kwargs = dict(
+            total_stat=float(total_stat),
             backend=backend,
-            method=kwargs.get("method", backend),
+            method=method,
             trace=trace,
             minuit=optimizer,
             **info,
         )
 
+        if copy_models:
+            return OptimizeResult(models=datasets.models.copy(), **kwargs)
+
+        return OptimizeResult._from_models_status(models=datasets.models, **kwargs)
+
     def covariance(self, datasets, optimize_result=None):
         """Estimate the covariance matrix.
 
@@ -264,15 +436,18 @@ class Fit:
             Results.
         """
         datasets, unique_pars = _parse_datasets(datasets=datasets)
+        return self._covariance(
+            datasets=datasets, unique_pars=unique_pars, optimize_result=optimize_result
+        )
+
+    def _covariance(self, datasets, unique_pars, optimize_result=None):
+        """Estimate the covariance matrix on already parsed datasets."""
         parameters = datasets.models.parameters
 
-        kwargs = self.covariance_opts.copy()
+        backend, compute, kwargs = self._covariance_backend
 
         if optimize_result is not None and optimize_result.backend == "minuit":
-            kwargs["minuit"] = optimize_result.minuit
-
-        backend = kwargs.pop("backend", self.backend)
-        compute = registry.get("covariance", backend)
+            kwargs = {**kwargs, "minuit": optimize_result.minuit}
 
         with unique_pars.restore_status():
             if self.backend == "minuit":
@@ -329,10 +504,8 @@ class Fit:
         """
         datasets, parameters = _parse_datasets(datasets=datasets)
 
-        kwargs = self.confidence_opts.copy()
-        backend = kwargs.pop("backend", self.backend)
+        backend, compute, kwargs = self._confidence_backend
 
-        compute = registry.get("confidence", backend)
         parameter = parameters[parameter]
 
         with parameters.restore_status():
@@ -349,7 +522,9 @@ class Fit:
         result["errn"] *= parameter.scale
         return result
 
-    def stat_profile(self, datasets, parameter, reoptimize=False):
+    def stat_profile(
+        self, datasets, parameter, reoptimize=False, n_jobs=None, parallel_backend=None
+    ):
         """Compute fit statistic profile.
 
         The method used is to vary one parameter, keeping all others fixed.
@@ -368,6 +543,12 @@ class Fit:
             and number of values is taken from the parameter object.
         reoptimize : bool, optional
             Re-optimize other parameters, when computing the confidence region. Default is False.
+        n_jobs : int, optional
+            Number of processes used to evaluate the scan values in parallel.
+            Default is None, which uses `~gammapy.utils.parallel.N_JOBS_DEFAULT`.
+        parallel_backend : {"multiprocessing", "ray"}, optional
+            Which backend to use for multiprocessing. Default is None, which uses
+            `~gammapy.utils.parallel.BACKEND_DEFAULT`.
 
         Returns
         -------
@@ -399,30 +580,28 @@ class Fit:
         parameter = parameters[parameter]
         values = parameter.scan_values
 
-        stats = []
-        fit_results = []
-        with parameters.restore_status():
-            for value in progress_bar(values, desc="Scan values"):
-                parameter.value = value
-                if reoptimize:
-                    parameter.frozen = True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-                stats.append(stat)
-
-        idx = datasets.parameters.index(parameter)
-        name = datasets.models.parameters_unique_names[idx]
+        stats, fit_results = self._stat_scan(
+            datasets=datasets,
+            parameters=parameters,
+            scan_parameters=[parameter],
+            points=np.reshape(values, (-1, 1)),
+            reoptimize=reoptimize,
+            n_jobs=n_jobs,
+            parallel_backend=parallel_backend,
+            desc="Scan values",
+        )
+
+        (name,) = _unique_names(datasets, [parameter])
 
         return {
             f"{name}_scan": values,
-            "stat_scan": np.array(stats),
+            "stat_scan": stats,
             "fit_results": fit_results,
         }
 
-    def stat_surface(self, datasets, x, y, reoptimize=False):
+    def stat_surface(
+        self, datasets, x, y, reoptimize=False, n_jobs=None, parallel_backend=None
+    ):
         """Compute fit statistic surface.
 
         The method used is to vary two parameters, keeping all others fixed.
@@ -444,6 +623,12 @@ class Fit:
             Parameters of interest.
         reoptimize : bool, optional
             Re-optimize other parameters, when computing the confidence region. Default is False.
+        n_jobs : int, optional
+            Number of processes used to evaluate the grid points in parallel.
+            Default is None, which uses `~gammapy.utils.parallel.N_JOBS_DEFAULT`.
+        parallel_backend : {"multiprocessing", "ray"}, optional
+            Which backend to use for multiprocessing. Default is None, which uses
+            `~gammapy.utils.parallel.BACKEND_DEFAULT`.
 
         Returns
         -------
@@ -483,34 +668,27 @@ class Fit:
         x = parameters[x]
         y = parameters[y]
 
-        stats = []
-        fit_results = []
+        x_values, y_values = np.meshgrid(x.scan_values, y.scan_values, indexing="ij")
+        points = np.stack([x_values.ravel(), y_values.ravel()], axis=-1)
 
-        with parameters.restore_status():
-            for x_value, y_value in progress_bar(
-                itertools.product(x.scan_values, y.scan_values), desc="Trial values"
-            ):
-                x.value, y.value = x_value, y_value
-
-                if reoptimize:
-                    x.frozen, y.frozen = True, True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-
-                stats.append(stat)
+        stats, fit_results = self._stat_scan(
+            datasets=datasets,
+            parameters=parameters,
+            scan_parameters=[x, y],
+            points=points,
+            reoptimize=reoptimize,
+            n_jobs=n_jobs,
+            parallel_backend=parallel_backend,
+            desc="Trial values",
+        )
 
         shape = (len(x.scan_values), len(y.scan_values))
-        stats = np.array(stats).reshape(shape)
+        stats = stats.reshape(shape)
 
         if reoptimize:
             fit_results = np.array(fit_results).reshape(shape)
 
-        i1, i2 = datasets.parameters.index(x), datasets.parameters.index(y)
-        name_x = datasets.models.parameters_unique_names[i1]
-        name_y = datasets.models.parameters_unique_names[i2]
+        name_x, name_y = _unique_names(datasets, [x, y])
 
         return {
             f"{name_x}_scan": x.scan_values,
@@ -519,6 +697,136 @@ class Fit:
             "fit_results": fit_results,
         }
 
+    def _stat_scan(
+        self,
+        datasets,
+        parameters,
+        scan_parameters,
+        points,
+        reoptimize,
+        n_jobs,
+        parallel_backend,
+        desc,
+    ):
+        """Evaluate the fit statistic at the given points of the scan parameters."""
+        if n_jobs is None:
+            n_jobs = parallel.N_JOBS_DEFAULT
+
+        if n_jobs > 1:
+            return self._stat_scan_parallel(
+                datasets=datasets,
+                scan_parameters=scan_parameters,
+                points=points,
+                reoptimize=reoptimize,
+                n_jobs=n_jobs,
+                parallel_backend=parallel_backend,
+                desc=desc,
+            )
+        elif reoptimize:
+            return self._stat_scan_reoptimize(
+                datasets=datasets,
+                parameters=parameters,
+                scan_parameters=scan_parameters,
+                points=points,
+                desc=desc,
+            )
+        else:
+            stats = datasets.stat_sum_scan(parameters=scan_parameters, values=points)
+            return stats, []
+
+    def _stat_scan_reoptimize(
+        self, datasets, parameters, scan_parameters, points, desc
+    ):
+        """Re-optimize the other parameters at the given points of the scan parameters.
+
+        Each optimization starts from the best fit of the previous point. With
+        the `"minuit"` backend the same `~iminuit.Minuit` object is re-used for
+        all points, and the errors of the previous point are used as initial
+        step sizes, instead of the errors of the parameters.
+        """
+        stats = np.empty(len(points), dtype=np.float64)
+        fit_results = []
+        kwargs = {}
+
+        with parameters.restore_status():
+            for par in scan_parameters:
+                par.frozen = True
+
+            trace_names = None
+
+            if self.store_trace:
+                trace_names = _unique_names(
+                    datasets, parameters.unique_parameters.free_parameters
+                )
+
+            for idx, values in enumerate(progress_bar(points, desc=desc)):
+                for par, value in zip(scan_parameters, values):
+                    par.value = value
+
+                result = self._optimize(
+                    datasets=datasets,
+                    parameters=parameters,
+                    copy_models=False,
+                    trace_names=trace_names,
+                    **kwargs,
+                )
+
+                if result.backend == "minuit":
+                    kwargs["minuit"] = result.minuit
+                    kwargs["update_errors"] = not result.success
+
+                stats[idx] = result.total_stat
+                fit_results.append(result)
+
+        return stats, fit_results
+
+    def _stat_scan_parallel(
+        self,
+        datasets,
+        scan_parameters,
+        points,
+        reoptimize,
+        n_jobs,
+        parallel_backend,
+        desc,
+    ):
+        """Evaluate the fit statistic at the given points using multiple processes.
+
+        The points are split into one chunk per job, so that the datasets are only
+        sent once to each process. The optimization results returned by the
+        processes do not contain the `~iminuit.Minuit` object.
+        """
+        index = {id(par): idx for idx, par in enumerate(datasets.parameters)}
+        indices = [index[id(par)] for par in scan_parameters]
+        chunks = np.array_split(points, min(n_jobs, len(points)))
+
+        # new instance, so that the minuit object of the last fit is not sent
+        fit = Fit(
+            backend=self.backend,
+            optimize_opts=self.optimize_opts,
+            covariance_opts=self.covariance_opts,
+            confidence_opts=self.confidence_opts,
+            store_trace=self.store_trace,
+        )
+
+        results = parallel.run_multiprocessing(
+            _stat_scan_points,
+            zip(
+                itertools.repeat(fit),
+                itertools.repeat(datasets),
+                itertools.repeat(indices),
+                chunks,
+                itertools.repeat(reoptimize),
+            ),
+            backend=parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            task_name=desc,
+        )
+
+        stats = np.concatenate([stats for stats, _ in results])
+        fit_results = [result for _, chunk in results for result in chunk]
+        return stats, fit_results
+
     def stat_contour(self, datasets, x, y, numpoints=10, sigma=1):
         """Compute stat contour.
 
@@ -530,7 +838,10 @@ class Fit:
         by re-optimising all other free parameters,
         and taking the fit statistic at that point.
 
-        Very compute-intensive and slow.
+        Very compute-intensive and slow. If the last optimization with the
+        `"minuit"` backend was run on the same datasets and the parameters are
+        still at its minimum, its `~iminuit.Minuit` object is re-used instead
+        of running migrad again.
 
         Parameters
         ----------
@@ -574,22 +885,92 @@ class Fit:
 
         datasets, parameters = _parse_datasets(datasets=datasets)
 
+        minuit = self._get_minuit(datasets, parameters)
+
+        with parameters.restore_status():
+            result, _ = self._stat_contour(
+                datasets, parameters, x, y, numpoints, sigma, minuit=minuit
+            )
+
+        return result
+
+    def stat_contours(self, datasets, pairs, numpoints=10, sigma=1):
+        """Compute stat contours for several pairs of parameters.
+
+        Same as `Fit.stat_contour`, but the same `~iminuit.Minuit` object is
+        re-used for all pairs, so that migrad is run at most once.
+
+        Parameters
+        ----------
+        datasets : `Datasets` or list of `Dataset`
+            Datasets to optimize.
+        pairs : list of tuple
+            Pairs ``(x, y)`` of parameters of interest.
+        numpoints : int, optional
+            Number of contour points. Default is 10.
+        sigma : float, optional
+            Number of standard deviations for the confidence level. Default is 1.
+
+        Returns
+        -------
+        results : dict
+            Dictionary with the unique names ``(name_x, name_y)`` of each pair as
+            keys and the `Fit.stat_contour` result of the pair as values.
+        """
+        datasets, parameters = _parse_datasets(datasets=datasets)
+
+        results = {}
+        minuit = self._get_minuit(datasets, parameters)
+
+        with parameters.restore_status():
+            for x, y in pairs:
+                result, minuit = self._stat_contour(
+                    datasets, parameters, x, y, numpoints, sigma, minuit=minuit
+                )
+                names = tuple(key for key in result if key != "success")
+                results[names] = result
+
+        return results
+
+    def _get_minuit(self, datasets, parameters):
+        """Minuit object of the last optimization with the same datasets and parameters.
+
+        Returns None if the last optimization was run on other datasets or
+        parameters, because the Minuit object then minimizes another function.
+        """
+        if self._minuit is None:
+            return None
+
+        for objects, others in zip(self._minuit_datasets, [datasets, parameters]):
+            others = list(others)
+
+            if len(objects) != len(others) or any(
+                obj is not other for obj, other in zip(objects, others)
+            ):
+                return None
+
+        return self._minuit
+
+    def _stat_contour(self, datasets, parameters, x, y, numpoints, sigma, minuit):
+        """Compute stat contour on already parsed datasets.
+
+        Returns the result and the `~iminuit.Minuit` object, to be re-used for
+        further contours.
+        """
         x = parameters[x]
         y = parameters[y]
 
-        i1, i2 = datasets.parameters.index(x), datasets.parameters.index(y)
-        name_x = datasets.models.parameters_unique_names[i1]
-        name_y = datasets.models.parameters_unique_names[i2]
+        name_x, name_y = _unique_names(datasets, [x, y])
 
-        with parameters.restore_status():
-            result = contour_iminuit(
-                parameters=parameters,
-                function=datasets.stat_sum,
-                x=x,
-                y=y,
-                numpoints=numpoints,
-                sigma=sigma,
-            )
+        result = contour_iminuit(
+            parameters=parameters,
+            function=datasets.stat_sum,
+            x=x,
+            y=y,
+            numpoints=numpoints,
+            sigma=sigma,
+            minuit=minuit,
+        )
 
         x = result["x"] * x.scale
         y = result["y"] * y.scale
@@ -598,7 +979,7 @@ class Fit:
             name_x: x,
             name_y: y,
             "success": result["success"],
-        }
+        }, result["minuit"]
 
 
 class FitStepResult:
@@ -703,8 +1084,24 @@ class OptimizeResult(FitStepResult):
         self._total_stat = total_stat
         self._trace = trace
         self._minuit = minuit
+        self._models_status = None
         super().__init__(**kwargs)
 
+    @classmethod
+    def _from_models_status(cls, models, **kwargs):
+        """Create result which copies the models only on first access.
+
+        The factor, scale, error and frozen status of the parameters are stored
+        instead, so that the copy reflects the best fit even if the models are
+        modified in the meantime, e.g. during a parameter scan.
+        """
+        result = cls(models=None, **kwargs)
+        status = [
+            (par.factor, par.scale, par.error, par.frozen) for par in models.parameters
+        ]
+        result._models_status = (models, status)
+        return result
+
     @property
     def minuit(self):
         """Minuit object."""
@@ -718,6 +1115,18 @@ class OptimizeResult(FitStepResult):
     @property
     def models(self):
         """Best fit models."""
+        if self._models_status is not None:
+            models, status = self._models_status
+            self._models = models.copy()
+
+            for par, (factor, scale, error, frozen) in zip(
+                self._models.parameters, status
+            ):
+                par.factor, par.scale = factor, scale
+                par.error, par.frozen = error, frozen
+
+            self._models_status = None
+
         return self._models
 
     @property
@@ -766,6 +1175,18 @@ class FitResult:
         self._optimize_result = optimize_result
         self._covariance_result = covariance_result
 
+        # the step results do not change, so the summary is cached once here
+        self._backend = self._method = self._message = self._success = None
+
+        if optimize_result is not None:
+            self._backend = optimize_result.backend
+            self._method = optimize_result.method
+            self._message = optimize_result.message
+            self._success = optimize_result.success
+
+            if covariance_result:
+                self._success &= covariance_result.success
+
     @property
     def minuit(self):
         """Minuit object."""
@@ -799,27 +1220,22 @@ class FitResult:
     @property
     def backend(self):
         """Optimizer backend used for the fit."""
-        return self.optimize_result.backend
+        return self._backend
 
     @property
     def method(self):
         """Optimizer method used for the fit."""
-        return self.optimize_result.method
+        return self._method
 
     @property
     def message(self):
         """Optimizer status message."""
-        return self.optimize_result.message
+        return self._message
 
     @property
     def success(self):
         """Total success flag."""
-        success = self.optimize_result.success
-
-        if self.covariance_result:
-            success &= self.covariance_result.success
-
-        return success
+        return self._success
 
     @property
     def optimize_result(self):
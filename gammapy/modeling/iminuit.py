@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """iminuit fitting functions."""
+
 import logging
 import numpy as np
 from scipy.stats import chi2, norm
@@ -50,7 +51,42 @@ def setup_iminuit(parameters, function, store_trace=False, **kwargs):
     return minuit, minuit_func
 
 
-def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
+def update_iminuit(minuit, parameters, errors=True):
+    """Update starting values, errors and limits of an existing `Minuit` object.
+
+    Parameters
+    ----------
+    minuit : `~iminuit.Minuit`
+        Minuit object created by `setup_iminuit` for the same parameters.
+    parameters : `~gammapy.modeling.Parameters`
+        Parameters with starting values.
+    errors : bool, optional
+        Whether to set the errors, i.e. the initial step sizes, from the
+        parameters. If False, the errors of the last minimization of the
+        Minuit object are kept. Default is True.
+
+    Returns
+    -------
+    updated : bool
+        False if the free parameters do not match the ones of the Minuit object.
+    """
+    pars, par_errors, limits = make_minuit_par_kwargs(parameters)
+
+    if tuple(pars) != minuit.parameters:
+        return False
+
+    minuit.values = list(pars.values())
+
+    if errors:
+        minuit.errors = list(par_errors.values())
+
+    minuit.limits = list(limits.values())
+    return True
+
+
+def optimize_iminuit(
+    parameters, function, store_trace=False, minuit=None, update_errors=True, **kwargs
+):
     """iminuit optimization.
 
     Parameters
@@ -61,6 +97,14 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
         Likelihood function.
     store_trace : bool, optional
         Store trace of the fit. Default is False.
+    minuit : `~iminuit.Minuit`, optional
+        Minuit object of a previous optimization of the same function, which is
+        re-used instead of setting up a new one. Ignored if ``store_trace``
+        is True. Default is None.
+    update_errors : bool, optional
+        Whether to set the initial step sizes of a re-used ``minuit`` from the
+        parameter errors. If False, the errors of its last minimization are
+        used instead. Default is True.
     **kwargs : dict
         Options passed to `iminuit.Minuit` constructor. If there is an entry
         'migrad_opts', those options will be passed to `iminuit.Minuit.migrad()`.
@@ -72,18 +116,32 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
     """
     migrad_opts = kwargs.pop("migrad_opts", {})
 
-    minuit, minuit_func = setup_iminuit(
-        parameters=parameters, function=function, store_trace=store_trace, **kwargs
-    )
+    if (
+        minuit is None
+        or store_trace
+        or not update_iminuit(minuit, parameters, errors=update_errors)
+    ):
+        minuit, minuit_func = setup_iminuit(
+            parameters=parameters, function=function, store_trace=store_trace, **kwargs
+        )
+    else:
+        minuit_func = None
 
+    nfcn = minuit.nfcn
     minuit.migrad(**migrad_opts)
 
+    if minuit_func is None:
+        trace = np.empty((0, len(parameters.free_parameters) + 1))
+    else:
+        trace = minuit_func.trace
+
     factors = minuit.values
     info = {
         "success": minuit.valid,
-        "nfev": minuit.nfcn,
+        "nfev": minuit.nfcn - nfcn,
+        "fval": minuit.fval,
         "message": _get_message(minuit, parameters),
-        "trace": minuit_func.trace,
+        "trace": trace,
     }
     optimizer = minuit
 
@@ -156,11 +214,46 @@ def confidence_iminuit(parameters, function, parameter, reoptimize, sigma, **kwa
     }
 
 
-def contour_iminuit(parameters, function, x, y, numpoints, sigma, **kwargs):
-    minuit, minuit_func = setup_iminuit(
-        parameters=parameters, function=function, store_trace=False, **kwargs
+def is_minimum_iminuit(minuit, parameters):
+    """Check whether the parameters are at the minimum found by a `Minuit` object.
+
+    Parameters
+    ----------
+    minuit : `~iminuit.Minuit`
+        Minuit object created by `setup_iminuit`.
+    parameters : `~gammapy.modeling.Parameters`
+        Parameters with current values.
+
+    Returns
+    -------
+    is_minimum : bool
+        True if migrad was run for the same free parameters and their factors
+        are still at its minimum.
+    """
+    if minuit is None or minuit.fmin is None:
+        return False
+
+    pars, _, _ = make_minuit_par_kwargs(parameters)
+    return tuple(pars) == minuit.parameters and list(pars.values()) == list(
+        minuit.values
     )
-    minuit.migrad()
+
+
+def contour_iminuit(
+    parameters, function, x, y, numpoints, sigma, minuit=None, **kwargs
+):
+    """Compute a contour with `~iminuit.Minuit.mncontour`.
+
+    If ``minuit`` is given and the parameters are still at its minimum, it is
+    re-used and migrad is not run again. After the contour, the parameters are
+    set back to the minimum, so that the returned ``minuit`` can be re-used for
+    further contours.
+    """
+    if not is_minimum_iminuit(minuit, parameters):
+        minuit, minuit_func = setup_iminuit(
+            parameters=parameters, function=function, store_trace=False, **kwargs
+        )
+        minuit.migrad()
 
     par_x = parameters[x]
     idx_x = parameters.free_parameters.index(par_x)
@@ -172,11 +265,13 @@ def contour_iminuit(parameters, function, x, y, numpoints, sigma, **kwargs):
 
     cl = chi2(2).cdf(sigma**2)
     contour = minuit.mncontour(x=x, y=y, size=numpoints, cl=cl)
+    parameters.set_parameter_factors(minuit.values)
     # TODO: add try and except to get the success
     return {
         "success": True,
         "x": contour[:, 0],
         "y": contour[:, 1],
+        "minuit": minuit,
     }
 
 
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
+import numpy as np
 
 __all__ = ["Likelihood"]
 
@@ -27,16 +28,32 @@ class Likelihood:
     def __init__(self, function, parameters, store_trace):
         self.function = function
         self.parameters = parameters
-        self.trace = []
         self.store_trace = store_trace
+        self._trace_parameters = parameters.free_parameters
+        self._trace = np.empty((0, len(self._trace_parameters) + 1))
+        self._trace_size = 0
+
+    @property
+    def trace(self):
+        """Trace of the fit as a `~numpy.ndarray`.
+
+        One row per function evaluation, with the total statistic in the
+        first column and the values of the free parameters in the others.
+        """
+        trace = self._trace[: self._trace_size]
+        return np.asarray(trace, dtype=np.float64, order="C")
 
     def store_trace_iteration(self, total_stat):
-        row = {"total_stat": total_stat}
-        pars = self.parameters.free_parameters
-        names = [f"par-{idx}" for idx in range(len(pars))]
-        vals = dict(zip(names, pars.value))
-        row.update(vals)
-        self.trace.append(row)
+        if self._trace_size == len(self._trace):
+            # double the buffer size, to get amortized constant time appends
+            trace = np.empty((max(2 * self._trace_size, 64), self._trace.shape[1]))
+            trace[: self._trace_size] = self._trace
+            self._trace = trace
+
+        row = self._trace[self._trace_size]
+        row[0] = total_stat
+        row[1:] = self._trace_parameters.value
+        self._trace_size += 1
 
     def fcn(self, factors):
         self.parameters.set_parameter_factors(factors)
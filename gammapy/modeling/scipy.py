@@ -34,6 +34,7 @@ def optimize_scipy(parameters, function, store_trace=False, **kwargs):
         "success": result.success,
         "message": result.message,
         "nfev": result.nfev,
+        "fval": result.fun,
         "trace": likelihood.trace,
     }
     optimizer = None
@@ -70,6 +70,7 @@ def optimize_sherpa(parameters, function, store_trace=False, **kwargs):
         "success": result[0],
         "message": result[3],
         "nfev": result[4]["nfev"],
+        "fval": result[2],
         "trace": statfunc.trace,
     }
 
@@ -4,6 +4,7 @@
 import pytest
 from numpy.testing import assert_allclose
 from astropy.table import Table
+from iminuit import Minuit
 from gammapy.datasets import Dataset, Datasets, SpectrumDatasetOnOff
 from gammapy.modeling import Fit, Parameter
 from gammapy.modeling.fit import FitResult
@@ -188,6 +189,37 @@ def test_optimize(backend):
     assert len(result.trace) == result.nfev
 
 
+def test_optimize_trace():
+    dataset = MyDataset()
+    fit = Fit(store_trace=True)
+    result = fit.optimize([dataset])
+
+    assert result.trace.colnames == ["total_stat", "test.x", "test.y", "test.z"]
+    assert len(result.trace) == result.nfev
+    assert_allclose(min(result.trace["total_stat"]), result.total_stat, rtol=1e-3)
+
+
+def test_optimize_change_opts():
+    dataset = MyDataset()
+    fit = Fit()
+    result = fit.optimize([dataset])
+    assert result.backend == "minuit"
+    assert result.method == "migrad"
+    assert len(result.trace) == 0
+    assert_allclose(result.total_stat, dataset.stat_sum())
+
+    fit.optimize_opts = {"backend": "scipy", "method": "L-BFGS-B"}
+    result = fit.optimize([dataset])
+    assert result.backend == "scipy"
+    assert result.method == "L-BFGS-B"
+    assert_allclose(result.total_stat, dataset.stat_sum())
+
+    fit.backend = "scipy"
+    fit.optimize_opts = {}
+    result = fit.optimize([dataset])
+    assert result.backend == "scipy"
+
+
 @pytest.mark.parametrize("backend", ["minuit"])
 def test_confidence(backend):
     dataset = MyDataset()
@@ -231,6 +263,19 @@ def test_stat_profile():
     assert_allclose(dataset.models.parameters["x"].value, 2)
 
 
+def test_stat_profile_n_jobs():
+    dataset = MyDataset()
+    fit = Fit()
+    fit.run([dataset])
+    dataset.models.parameters["x"].scan_n_values = 3
+    result = fit.stat_profile(datasets=[dataset], parameter="x", n_jobs=2)
+
+    assert_allclose(result["test.x_scan"], [0, 2, 4], atol=1e-7)
+    assert_allclose(result["stat_scan"], [4, 0, 4], atol=1e-7)
+    assert len(result["fit_results"]) == 0
+    assert_allclose(dataset.models.parameters["x"].value, 2)
+
+
 def test_stat_profile_reoptimize():
     dataset = MyDataset()
     fit = Fit()
@@ -238,14 +283,40 @@ def test_stat_profile_reoptimize():
 
     dataset.models.parameters["y"].value = 0
     dataset.models.parameters["x"].scan_n_values = 3
+    errors = [par.error for par in dataset.models.parameters]
     result = fit.stat_profile(datasets=[dataset], parameter="x", reoptimize=True)
 
+    assert [par.error for par in dataset.models.parameters] == errors
+
     assert_allclose(result["test.x_scan"], [0, 2, 4], atol=1e-7)
     assert_allclose(result["stat_scan"], [4, 0, 4], atol=1e-7)
     assert_allclose(
         result["fit_results"][0].total_stat, result["stat_scan"][0], atol=1e-7
     )
 
+    models = result["fit_results"][0].models
+    assert models is not dataset.models
+    assert [par.error for par in models.parameters] == errors
+    assert models.parameters["x"].frozen
+    assert_allclose(models.parameters["x"].value, 0, atol=1e-7)
+    assert_allclose(models.parameters["y"].value, 3e2, rtol=1e-5)
+
+    models = result["fit_results"][2].models
+    assert [par.error for par in models.parameters] == errors
+
+
+def test_stat_profile_reoptimize_trace():
+    dataset = MyDataset()
+    fit = Fit(store_trace=True)
+    fit.run([dataset])
+
+    dataset.models.parameters["x"].scan_n_values = 3
+    result = fit.stat_profile(datasets=[dataset], parameter="x", reoptimize=True)
+
+    for fit_result in result["fit_results"]:
+        assert fit_result.trace.colnames == ["total_stat", "test.y", "test.z"]
+        assert len(fit_result.trace) == fit_result.nfev
+
 
 def test_stat_surface():
     dataset = MyDataset()
@@ -274,6 +345,58 @@ def test_stat_surface():
     assert_allclose(dataset.models.parameters["y"].value, 3e2)
 
 
+def test_stat_surface_n_jobs():
+    dataset = MyDataset()
+    fit = Fit()
+    fit.run([dataset])
+
+    x_values = [1, 2, 3]
+    y_values = [2e2, 3e2, 4e2]
+
+    dataset.models.parameters["x"].scan_values = x_values
+    dataset.models.parameters["y"].scan_values = y_values
+    result = fit.stat_surface(datasets=[dataset], x="x", y="y", n_jobs=2)
+
+    expected_stat = [
+        [1.0001e04, 1.0000e00, 1.0001e04],
+        [1.0000e04, 0.0000e00, 1.0000e04],
+        [1.0001e04, 1.0000e00, 1.0001e04],
+    ]
+    assert_allclose(result["stat_scan"], expected_stat, atol=1e-7)
+    assert len(result["fit_results"]) == 0
+    assert_allclose(dataset.models.parameters["x"].value, 2)
+    assert_allclose(dataset.models.parameters["y"].value, 3e2)
+
+
+def test_stat_surface_reoptimize_n_jobs():
+    dataset = MyDataset()
+    fit = Fit()
+    fit.run([dataset])
+
+    x_values = [1, 2, 3]
+    y_values = [2e2, 3e2, 4e2]
+
+    dataset.models.parameters["z"].value = 0
+    dataset.models.parameters["x"].scan_values = x_values
+    dataset.models.parameters["y"].scan_values = y_values
+
+    result = fit.stat_surface(
+        datasets=[dataset], x="x", y="y", reoptimize=True, n_jobs=2
+    )
+
+    expected_stat = [
+        [1.0001e04, 1.0000e00, 1.0001e04],
+        [1.0000e04, 0.0000e00, 1.0000e04],
+        [1.0001e04, 1.0000e00, 1.0001e04],
+    ]
+    assert_allclose(result["stat_scan"], expected_stat, atol=1e-7)
+    assert result["fit_results"].shape == (3, 3)
+    assert_allclose(
+        result["fit_results"][2][1].total_stat, result["stat_scan"][2][1], atol=1e-7
+    )
+    assert_allclose(dataset.models.parameters["z"].value, 0)
+
+
 def test_stat_surface_reoptimize():
     dataset = MyDataset()
     fit = Fit()
@@ -325,6 +448,52 @@ def test_stat_contour():
     assert_allclose(dataset.models.parameters["y"].value, 300)
 
 
+def assert_contour_extent(actual, desired, names):
+    # mncontour may sample different points along the same contour
+    for name in names:
+        assert_allclose(min(actual[name]), min(desired[name]), rtol=1e-5)
+        assert_allclose(max(actual[name]), max(desired[name]), rtol=1e-5)
+
+
+def test_stat_contours(monkeypatch):
+    dataset = MyDataset()
+    fit = Fit(backend="minuit")
+    fit.optimize([dataset])
+    contour = Fit().stat_contour(datasets=[dataset], x="y", y="z")
+
+    # the minuit object of the optimization is re-used, without running migrad
+    def migrad(*args, **kwargs):
+        raise AssertionError("migrad should not be called")
+
+    monkeypatch.setattr(Minuit, "migrad", migrad)
+
+    result = fit.stat_contour(datasets=[dataset], x="y", y="z")
+    assert_contour_extent(result, contour, ["test.y", "test.z"])
+
+    results = fit.stat_contours(datasets=[dataset], pairs=[("y", "z"), ("x", "y")])
+
+    assert list(results) == [("test.y", "test.z"), ("test.x", "test.y")]
+    assert_contour_extent(results[("test.y", "test.z")], contour, ["test.y", "test.z"])
+    assert results[("test.x", "test.y")]["success"]
+    assert_allclose(dataset.models.parameters["y"].value, 300)
+
+
+def test_stat_contour_other_datasets():
+    dataset_1 = MyDataset(name="test-1")
+    dataset_2 = MyDataset(name="test-2")
+    dataset_2._models = dataset_1.models
+    dataset_1.models.parameters["x"].frozen = True
+
+    fit = Fit(backend="minuit")
+    fit.optimize([dataset_1, dataset_2])
+    result = fit.stat_contour(datasets=[dataset_1], x="y", y="z", numpoints=4)
+
+    expected = Fit().stat_contour(datasets=[dataset_1], x="y", y="z", numpoints=4)
+    assert_contour_extent(result, expected, ["test.y", "test.z"])
+    assert_allclose(min(result["test.y"]), 299, rtol=1e-5)
+    assert_allclose(max(result["test.y"]), 301, rtol=1e-5)
+
+
 @requires_data()
 def test_write(tmpdir):
     datasets = Datasets()
@@ -53,6 +53,32 @@ def test_iminuit_basic():
     assert_allclose(minuit.values["par_002_z"], 4, rtol=1e-3)
 
 
+def test_iminuit_reuse_minuit():
+    ds = MyDataset()
+    pars = ds.models.parameters
+    _, _, minuit = optimize_iminuit(function=ds.fcn, parameters=pars)
+
+    pars["x"].value = 1.8
+    pars["x"].frozen = True
+    factors, info, minuit_new = optimize_iminuit(
+        function=ds.fcn, parameters=pars, minuit=minuit
+    )
+
+    # free parameters changed, a new Minuit object is needed
+    assert minuit_new is not minuit
+
+    pars["x"].value = 2.2
+    factors, info, minuit_reused = optimize_iminuit(
+        function=ds.fcn, parameters=pars, minuit=minuit_new
+    )
+
+    assert minuit_reused is minuit_new
+    assert info["success"]
+    assert info["nfev"] < minuit_reused.nfcn
+    assert_allclose(pars["x"].value, 2.2)
+    assert_allclose(ds.fcn(), 1, rtol=1e-4)
+
+
 def test_iminuit_stepsize():
     ds = MyDataset()
     pars = ds.models.parameters
@@ -7,6 +7,7 @@ from .fit_statistics_cython import (
     cash_sum_cython,
     f_cash_root_cython,
     norm_bounds_cython,
+    wstat_sum_cython,
 )
 from .variability import (
     TimmerKonig_lightcurve_simulator,
@@ -28,6 +29,7 @@ __all__ = [
     "get_wstat_mu_bkg",
     "norm_bounds_cython",
     "wstat",
+    "wstat_sum_cython",
     "WStatCountsStatistic",
     "compute_fvar",
     "compute_fpp",
@@ -118,6 +118,19 @@ def test_cash_sum_cython(test_data):
     assert_allclose(stat, ref)
 
 
+def test_wstat_sum_cython(test_data):
+    data = {
+        key: np.array(test_data[key], dtype=float)
+        for key in ["n_on", "n_off", "alpha", "mu_sig"]
+    }
+    data["alpha"][2] = 0
+    stat = stats.wstat_sum_cython(**data)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ref = np.nan_to_num(stats.wstat(**data)).sum()
+    assert_allclose(stat, ref)
+
+
 def test_cash_bad_truncation():
     with pytest.raises(ValueError):
         stats.cash(10, 10, 0.0)
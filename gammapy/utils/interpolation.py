@@ -17,6 +17,80 @@ __all__ = [
 INTERPOLATION_ORDER = {None: 0, "nearest": 0, "linear": 1, "quadratic": 2, "cubic": 3}
 
 
+class _BilinearInterp2D:
+    """Bilinear interpolation on a rectilinear 2D grid.
+
+    Points outside the grid are linearly extrapolated. Trailing dimensions of
+    the values are interpolated jointly.
+
+    Parameters
+    ----------
+    grid : tuple of `~numpy.ndarray`
+        Grid points along the two dimensions.
+    values : `~numpy.ndarray`
+        Values on the grid.
+    """
+
+    def __init__(self, grid, values):
+        # contiguous float64 grids avoid conversions in every searchsorted call
+        self.grid = tuple(np.ascontiguousarray(g, dtype=np.float64) for g in grid)
+        self.values = np.asarray(values)
+
+    def __call__(self, points):
+        """Interpolate at the given points.
+
+        Parameters
+        ----------
+        points : tuple of `~numpy.ndarray`
+            Coordinate arrays of the form (x, y), broadcast against each other.
+        """
+        (xg, yg), (x, y) = self.grid, [np.asarray(p) for p in points]
+
+        ix = np.clip(np.searchsorted(xg, x, side="right") - 1, 0, len(xg) - 2)
+        iy = np.clip(np.searchsorted(yg, y, side="right") - 1, 0, len(yg) - 2)
+
+        tx = (x - xg[ix]) / (xg[ix + 1] - xg[ix])
+        ty = (y - yg[iy]) / (yg[iy + 1] - yg[iy])
+
+        idx = (Ellipsis,) + (np.newaxis,) * (self.values.ndim - 2)
+        tx, ty = tx[idx], ty[idx]
+
+        values = self.values
+        return (
+            (1 - tx) * (1 - ty) * values[ix, iy]
+            + tx * (1 - ty) * values[ix + 1, iy]
+            + (1 - tx) * ty * values[ix, iy + 1]
+            + tx * ty * values[ix + 1, iy + 1]
+        )
+
+
+class _ConstantInterp:
+    """Interpolation of values given on a grid with a single point.
+
+    Parameters
+    ----------
+    values : `~numpy.ndarray`
+        Values on the grid.
+    ndim : int
+        Number of grid dimensions, trailing dimensions of the values are kept.
+    """
+
+    def __init__(self, values, ndim):
+        values = np.asarray(values)
+        self.values = values.reshape(values.shape[ndim:])
+
+    def __call__(self, points):
+        """Return the constant value, broadcast to the shape of the points.
+
+        Parameters
+        ----------
+        points : tuple of `~numpy.ndarray`
+            Coordinate arrays of the form (x_1, x_2, x_3, ...).
+        """
+        shape = np.broadcast_shapes(*[np.shape(p) for p in points])
+        return np.broadcast_to(self.values, shape + self.values.shape).copy()
+
+
 class ScaledRegularGridInterpolator:
     """Thin wrapper around `scipy.interpolate.RegularGridInterpolator`.
 
@@ -30,7 +104,8 @@ class ScaledRegularGridInterpolator:
     points : tuple of `~numpy.ndarray` or `~astropy.units.Quantity`
         Tuple of points passed to `RegularGridInterpolator`.
     values : `~numpy.ndarray`
-        Values passed to `RegularGridInterpolator`.
+        Values passed to `RegularGridInterpolator`. Trailing dimensions beyond
+        the number of points are interpolated jointly and kept in the output.
     points_scale : tuple of str
         Interpolation scale used for the points.
     values_scale : {'lin', 'log', 'sqrt'}
@@ -82,9 +157,29 @@ class ScaledRegularGridInterpolator:
                 )
 
         if np.any(self._include_dimensions):
-            values_scaled = np.squeeze(values_scaled)
-
-        if axis is None:
+            excluded = tuple(np.flatnonzero(~np.array(self._include_dimensions)))
+            values_scaled = np.squeeze(values_scaled, axis=excluded)
+
+        extrapolated = kwargs.get("fill_value", np.nan) is None
+        extrapolated &= not kwargs["bounds_error"]
+
+        # linear interpolation with extrapolation in 2D uses a dedicated kernel
+        self._linear_2d = (
+            axis is None
+            and sum(self._include_dimensions) == 2
+            and method in [None, "linear"]
+            and extrapolated
+        )
+
+        # interpolation is a no-op if all dimensions have a single point and
+        # the values are extrapolated, otherwise points off the grid are filled
+        self._constant = not np.any(self._include_dimensions) and extrapolated
+
+        if self._constant:
+            self._interpolate = _ConstantInterp(values_scaled, ndim=len(points))
+        elif self._linear_2d:
+            self._interpolate = _BilinearInterp2D(points_scaled, values_scaled)
+        elif axis is None:
             self._interpolate = scipy.interpolate.RegularGridInterpolator(
                 points=points_scaled, values=values_scaled, **kwargs
             )
@@ -124,10 +219,28 @@ class ScaledRegularGridInterpolator:
         points = self._scale_points(points=points)
 
         if self.axis is None:
-            points = np.broadcast_arrays(*points)
-            points_interp = np.stack([_.flat for _ in points]).T
-            values = self._interpolate(points_interp, method, **kwargs)
-            values = self.scale.inverse(values.reshape(points[0].shape))
+            if self._constant or (
+                self._linear_2d and method in [None, "linear"] and not kwargs
+            ):
+                # points are broadcast in the kernel, so that for grids of points
+                # such as (x[:, np.newaxis], y) each axis is only searched once
+                values = self.scale.inverse(self._interpolate(points))
+            else:
+                points = np.broadcast_arrays(*points)
+                interpolate = self._interpolate
+
+                if self._linear_2d:
+                    interpolate = scipy.interpolate.RegularGridInterpolator(
+                        points=interpolate.grid,
+                        values=interpolate.values,
+                        bounds_error=False,
+                        fill_value=None,
+                    )
+
+                points_interp = np.stack([_.flat for _ in points]).T
+                values = interpolate(points_interp, method, **kwargs)
+                shape = points[0].shape + values.shape[1:]
+                values = self.scale.inverse(values.reshape(shape))
         else:
             values = self._interpolate(points[0])
             values = self.scale.inverse(values)
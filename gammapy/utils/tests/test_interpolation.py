@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
-from gammapy.utils.interpolation import LogScale
+import scipy.interpolate
+from gammapy.utils.interpolation import LogScale, ScaledRegularGridInterpolator
 from gammapy.utils.testing import assert_allclose
 
 
@@ -12,3 +13,86 @@ def test_LogScale_inverse():
     assert_allclose(log_values, np.array([0, np.log(1e-5), np.log(tiny)]))
     inv_values = log_scale.inverse(log_values)
     assert_allclose(inv_values, np.array([1, 1e-5, 0]))
+
+
+def test_ScaledRegularGridInterpolator_trailing_dims():
+    x, y = np.arange(3.0), np.arange(4.0)
+    values = np.stack([x[:, np.newaxis] + y, x[:, np.newaxis] * y], axis=-1)
+
+    interp = ScaledRegularGridInterpolator((x, y), values)
+    result = interp((np.array([0.5, 1.5]), 2.5))
+
+    assert result.shape == (2, 2)
+    assert_allclose(result[:, 0], [3.0, 4.0])
+    assert_allclose(result[:, 1], [1.25, 3.75])
+
+
+def test_ScaledRegularGridInterpolator_2d():
+    x, y = np.array([0.0, 1.0, 3.0]), np.array([0.0, 2.0, 3.0, 5.0])
+    values = np.sin(x[:, np.newaxis]) + np.cos(y)
+    points = (np.array([-0.5, 0.3, 2.0, 3.5]), np.array([[0.1], [4.9], [6.0]]))
+
+    interp = ScaledRegularGridInterpolator((x, y), values)
+    interp_scipy = scipy.interpolate.RegularGridInterpolator(
+        (x, y), values, bounds_error=False, fill_value=None
+    )
+
+    xi = np.stack([_.flat for _ in np.broadcast_arrays(*points)]).T
+    desired = interp_scipy(xi).reshape((3, 4))
+    assert_allclose(interp(points, clip=False), desired)
+
+    desired = interp_scipy(xi, method="nearest").reshape((3, 4))
+    assert_allclose(interp(points, method="nearest", clip=False), desired)
+
+
+def test_ScaledRegularGridInterpolator_2d_nan_on_nodes():
+    x, y = np.array([0.0, 1.0, 2.0, 3.0]), np.array([0.0, 1.0, 2.0])
+    values = np.arange(12.0).reshape((4, 3))
+    values[1, 1] = np.nan
+    # points exactly on the grid nodes next to the NaN value
+    points = (np.array([0.0, 1.0, 2.0, 3.0, 0.5])[:, np.newaxis], y)
+
+    interp = ScaledRegularGridInterpolator((x, y), values)
+    interp_scipy = scipy.interpolate.RegularGridInterpolator(
+        (x, y), values, bounds_error=False, fill_value=None
+    )
+
+    xi = np.stack([_.flat for _ in np.broadcast_arrays(*points)]).T
+    desired = interp_scipy(xi).reshape((5, 3))
+    actual = interp(points, clip=False)
+
+    assert_allclose(np.isnan(actual), np.isnan(desired))
+    assert_allclose(actual, desired)
+
+
+def test_ScaledRegularGridInterpolator_single_point():
+    values = np.array([[2.0]])
+    interp = ScaledRegularGridInterpolator(
+        (np.array([1.0]), np.array([3.0])), values, method="nearest"
+    )
+
+    result = interp((np.array([0.0, 1.0, 5.0]), 2.0))
+    assert_allclose(result, [2.0, 2.0, 2.0])
+
+    interp = ScaledRegularGridInterpolator(
+        (np.array([1.0]), np.array([3.0])),
+        values,
+        method="nearest",
+        extrapolate=False,
+    )
+
+    result = interp((np.array([0.0, 1.0, 5.0]), 3.0))
+    assert_allclose(result, [np.nan, 2.0, np.nan])
+
+
+def test_ScaledRegularGridInterpolator_2d_grid_points():
+    x, y = np.array([0.0, 1.0, 3.0]), np.array([0.0, 2.0, 3.0, 5.0])
+    values = x[:, np.newaxis] * y
+    interp = ScaledRegularGridInterpolator((x, y), values, points_scale=("lin", "lin"))
+
+    xi, yi = np.array([0.5, 2.0]), np.array([1.0, 4.0, 4.5])
+    result = interp((xi[:, np.newaxis], yi))
+
+    assert result.shape == (2, 3)
+    assert_allclose(result, xi[:, np.newaxis] * yi)
+    assert_allclose(interp((2.0, 4.0)), 8.0)